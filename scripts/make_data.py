@@ -7,8 +7,10 @@ import sys
 # import third-party libraries
 from pathlib import Path
 
-# path to the root of the project
-dir_prj = Path(__file__).parent.parent
+# path to this script, its name without the .py extension, and the root of the project
+script_pth = Path(__file__)
+script_stem = script_pth.stem
+dir_prj = script_pth.parent.parent
 
 # if the project package is not installed in the environment, add the source directory to the system path
 if importlib.util.find_spec('icloud_contacts_organizer') is None:
@@ -31,21 +33,20 @@ from .config import LOG_LEVEL, INPUT_DATA, OUTPUT_DATA
 if __name__ == '__main__':
 
     # get datestring for file naming yyyymmddThhmmss
-    date_string = datetime.now().strftime("%Y%m%dT%H%M%S")
+    date_string = datetime.now().isoformat(timespec='seconds').replace(':', '').replace('-', '')
 
     # path to save log file
     log_dir = dir_prj / 'data' / 'logs'
 
     # ensure location to save logs exists
-    if not log_dir.exists():
-        log_dir.mkdir(parents=True)
+    log_dir.mkdir(parents=True, exist_ok=True)
 
     # create full path to log file
-    log_name = f'{Path(__file__).stem}_{date_string}.log'
+    log_name = f'{script_stem}_{date_string}.log'
     log_file = log_dir / log_name
 
     # use the log level from the config to set up logging
-    logger = get_logger(logger_name=f"{Path(__file__).stem}", level=LOG_LEVEL)
+    logger = get_logger(logger_name=script_stem, level=LOG_LEVEL)
 
     ### Main processing - put your data processing code here ###
     logger.info(f'Starting {dir_prj.name} data processing.')
@@ -56,9 +57,10 @@ if __name__ == '__main__':
     ###EXAMPLE PROCESSING, replace with your own code ###
 
     # late imports - not PEP8 compliant, should be at top, but makes it easier to clean up file for your processing steps
-    from arcgis.features import GeoAccessor
     import arcpy
-    import pandas as pd
+    import pyarrow as pa
+    from pyarrow import compute as pa_compute
+    from pyarrow import csv as pa_csv
 
     # constants / parameters for processing - according to PEP8, these should be defined in config.py or toward the top of the script
     X_COLUMN = 'longitude'
@@ -93,13 +95,114 @@ if __name__ == '__main__':
         logger.error(err_msg)
         raise FileNotFoundError(err_msg)
 
-    # read the input data into a pandas DataFrame
-    df = pd.read_csv(INPUT_DATA)
-
-    # convert the DataFrame to a spatially enabled DataFrame
-    sdf = GeoAccessor.from_xy(df, x_column=X_COLUMN, y_column=Y_COLUMN, sr=SPATIAL_REFERENCE_WKID)
-
-    # save the spatially enabled DataFrame to a file geodatabase feature class
-    sdf.spatial.to_featureclass(location=OUTPUT_DATA)
+    # read the input data into a PyArrow table, ensuring the coordinate columns are contiguous float64 buffers
+    tbl = pa_csv.read_csv(
+        INPUT_DATA,
+        read_options=pa_csv.ReadOptions(block_size=64 << 20),
+        convert_options=pa_csv.ConvertOptions(column_types={X_COLUMN: pa.float64(), Y_COLUMN: pa.float64()}),
+    )
+
+    # get the ArcGIS field type for each column based on the Arrow data type
+    def get_field_type(arrow_type: pa.DataType) -> str:
+        if pa.types.is_floating(arrow_type):
+            return 'DOUBLE'
+        elif pa.types.is_integer(arrow_type):
+            return 'BIGINTEGER'
+        elif pa.types.is_boolean(arrow_type):
+            return 'SHORT'
+        elif pa.types.is_timestamp(arrow_type) or pa.types.is_date(arrow_type):
+            return 'DATE'
+        return 'TEXT'
+
+    # cast columns stored as text, including types without a matching field type such as times, to strings
+    for idx, fld in enumerate(tbl.schema):
+        if get_field_type(fld.type) == 'TEXT' and not pa.types.is_string(fld.type):
+            tbl = tbl.set_column(idx, fld.name, pa_compute.cast(tbl.column(idx), pa.string()))
+
+    # get column values as a Python list, using numpy for null free numeric columns since it is much faster
+    def get_column_list(col: pa.ChunkedArray) -> list:
+        if col.null_count == 0 and (pa.types.is_floating(col.type) or pa.types.is_integer(col.type)):
+            return col.to_numpy().tolist()
+        return col.to_pylist()
+
+    # get the field description for AddFields, sizing text fields to fit the longest string in the column
+    def get_field_description(field_name: str, col_name: str) -> list:
+        field_type = get_field_type(tbl.schema.field(col_name).type)
+        if field_type == 'TEXT':
+            max_length = pa_compute.max(pa_compute.utf8_length(tbl.column(col_name))).as_py()
+            return [field_name, field_type, col_name, max(max_length or 1, 1)]
+        return [field_name, field_type, col_name]
+
+    # map each column name to a valid, unique field name, avoiding names reserved by the geodatabase
+    reserved_names = {'OBJECTID', 'SHAPE', 'SHAPE_LENGTH', 'SHAPE_AREA'}
+    field_map = {}
+    for col_name in tbl.column_names:
+        field_name = base_name = arcpy.ValidateFieldName(col_name, str(gdb_pth))
+        idx = 1
+        while field_name.upper() in reserved_names or field_name.upper() in {f.upper() for f in field_map.values()}:
+            field_name = f'{base_name}_{idx}'
+            idx += 1
+        field_map[col_name] = field_name
+
+    # replace any existing output, consistent with the previous overwrite behavior of to_featureclass
+    if arcpy.Exists(str(OUTPUT_DATA)):
+        arcpy.management.Delete(str(OUTPUT_DATA))
+
+    # batch commits and skip updating the spatial index for every feature when writing features
+    arcpy.env.autoCommit = 100000
+    arcpy.env.maintainSpatialIndex = False
+
+    # get the coordinates and column values as lists, pairing the coordinates for the point geometry
+    x_lst = tbl.column(X_COLUMN).to_numpy().tolist()
+    y_lst = tbl.column(Y_COLUMN).to_numpy().tolist()
+    col_lsts = [get_column_list(tbl.column(col_name)) for col_name in field_map.keys()]
+
+    # create the output feature class once with the target schema
+    out_fc = arcpy.management.CreateFeatureclass(
+        str(gdb_pth), OUTPUT_DATA.name, 'POINT', spatial_reference=arcpy.SpatialReference(SPATIAL_REFERENCE_WKID)
+    )[0]
+
+    # track the edit session state, so only what is still open is closed if anything goes wrong
+    editor = None
+    operation_open = False
+
+    try:
+        arcpy.management.AddFields(
+            out_fc, [get_field_description(fld, col) for col, fld in field_map.items()]
+        )
+
+        # use an edit session without undo logging, since a bulk load has nothing to roll back to
+        editor = arcpy.da.Editor(str(gdb_pth))
+        editor.startEditing(with_undo=False, multiuser_mode=False)
+        editor.startOperation()
+        operation_open = True
+
+        # write the features column by column using the validated field names
+        with arcpy.da.InsertCursor(out_fc, ['SHAPE@XY', *field_map.values()]) as insert_cursor:
+            for row in zip(zip(x_lst, y_lst), *col_lsts):
+                insert_cursor.insertRow(row)
+
+        editor.stopOperation()
+        operation_open = False
+        editor.stopEditing(save_changes=True)
+
+    # if anything goes wrong, discard the edits and remove the partially created output before raising the error
+    except Exception:
+
+        # do not let a failure closing the edit session replace the original error or skip removing the output
+        try:
+            if operation_open:
+                editor.abortOperation()
+            if editor is not None and editor.isEditing:
+                editor.stopEditing(save_changes=False)
+        except Exception:
+            logger.warning('Unable to cleanly close the edit session after the failed load.')
+
+        if arcpy.Exists(out_fc):
+            arcpy.management.Delete(out_fc)
+        raise
+
+    # build the spatial index once after all the features are loaded
+    arcpy.management.AddSpatialIndex(out_fc)
 
     logger.info(f'Successfully completed data processing for {dir_prj.name}')
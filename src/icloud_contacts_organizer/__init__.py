@@ -10,5 +10,5 @@ from ._main import example_function, ExampleObject
 
 __all__ = ["example_function", "ExampleObject", "utils"]
 
-# configure package-level logging
+# configure package-level logging once, submodules get this same logger by name without reconfiguring it
 logger = utils.get_logger("icloud_contacts_organizer", level="DEBUG", add_stream_handler=False)
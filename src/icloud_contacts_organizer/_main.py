@@ -1,14 +1,119 @@
 """Main module for icloud_contacts_organizer package."""
 
+from importlib.util import find_spec
+import logging
+import os
 from typing import Union
 from pathlib import Path
 
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 
-from .utils import get_logger
+# the package-level logger, configured once when the package is imported
+logger = logging.getLogger("icloud_contacts_organizer")
 
-# configure module logging, the same logger as the package-level logger
-logger = get_logger("icloud_contacts_organizer", level="DEBUG", add_stream_handler=False)
+# PyArrow is only used for reading large files, and only when installed
+_HAS_PYARROW = find_spec("pyarrow") is not None
+
+if _HAS_PYARROW:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+# files at least this large (roughly 100k rows) are read with PyArrow if available, otherwise in chunks
+_LARGE_FILE_THRESHOLD = 10 * 1024 * 1024
+
+# number of rows read per chunk when reading large files with the C engine
+_CSV_CHUNKSIZE = 200_000
+
+# starting with Pandas 3, copy on write is always active, and the copy keyword is deprecated
+_CONCAT_KWARGS = {} if int(pd.__version__.split(".")[0]) >= 3 else {"copy": False}
+
+# values the C engine reads as missing and as booleans, so the PyArrow reader can parse the same way
+_NA_VALUES = ["", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+              "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"]
+_TRUE_VALUES = ["True", "TRUE", "true"]
+_FALSE_VALUES = ["False", "FALSE", "false"]
+
+
+def _is_local_file(in_path) -> bool:
+    """Determine if the input is a path to a local file, as opposed to a URL or file-like object."""
+    return isinstance(in_path, (str, os.PathLike)) and os.path.isfile(in_path)
+
+
+def _read_csv_pyarrow(in_path: Union[str, Path]) -> pd.DataFrame:
+    """Read a CSV with the PyArrow parser, matching the types the C engine infers."""
+    convert_kwargs = dict(
+        null_values=_NA_VALUES,
+        strings_can_be_null=True,
+        true_values=_TRUE_VALUES,
+        false_values=_FALSE_VALUES,
+    )
+    tbl = pa_csv.read_csv(str(in_path), convert_options=pa_csv.ConvertOptions(**convert_kwargs))
+
+    # the C engine does not infer dates or times, so re-read any temporal columns as the original text
+    temporal_cols = [fld.name for fld in tbl.schema if pa.types.is_temporal(fld.type)]
+    if len(temporal_cols):
+        column_types = {col: pa.string() for col in temporal_cols}
+        tbl = pa_csv.read_csv(
+            str(in_path), convert_options=pa_csv.ConvertOptions(column_types=column_types, **convert_kwargs)
+        )
+
+    # the C engine reads columns with only missing values as floats
+    for idx, fld in enumerate(tbl.schema):
+        if pa.types.is_null(fld.type):
+            tbl = tbl.set_column(idx, fld.name, tbl.column(idx).cast(pa.float64()))
+
+    # boolean columns with missing values are converted to objects, which the C engine fills with NaN, not None
+    bool_null_cols = [
+        fld.name for fld in tbl.schema if pa.types.is_boolean(fld.type) and tbl.column(fld.name).null_count
+    ]
+
+    df = tbl.to_pandas(self_destruct=True, split_blocks=True)
+
+    for col in bool_null_cols:
+        values = df[col].to_numpy(dtype=object, copy=True)
+        values[pd.isna(values)] = float("nan")
+        df[col] = values
+
+    return df
+
+
+def _read_csv_chunked(in_path: Union[str, Path]) -> pd.DataFrame:
+    """Read a CSV in chunks with the C engine, matching the types inferred when reading in one shot."""
+    chunks = list(pd.read_csv(in_path, engine="c", chunksize=_CSV_CHUNKSIZE))
+    df = pd.concat(chunks, **_CONCAT_KWARGS)
+
+    # types are inferred per chunk, so if text was found in only some chunks, a column ends up with a mix
+    # of text and other values, whereas reading in one shot reads the entire column as text
+    mixed_cols = []
+    for col in df.columns:
+        if len({chunk[col].dtype for chunk in chunks}) > 1 and not is_numeric_dtype(df[col].dtype):
+            value_types = set(map(type, df[col].dropna()))
+            if str in value_types and len(value_types) > 1:
+                mixed_cols.append(col)
+
+    # re-read just these columns as text to get the same values as reading in one shot
+    if len(mixed_cols):
+        text_df = pd.read_csv(in_path, engine="c", usecols=mixed_cols, dtype=str, low_memory=False)
+        for col in mixed_cols:
+            df[col] = text_df[col]
+
+    return df
+
+
+def _read_csv_fast(in_path: Union[str, Path]) -> pd.DataFrame:
+    """Read a CSV using the fastest approach for the size of the file."""
+    # small files, and anything not a local file, are read in one shot, since chunking and threading
+    # overhead outweighs any benefit
+    if not _is_local_file(in_path) or os.stat(in_path).st_size < _LARGE_FILE_THRESHOLD:
+        return pd.read_csv(in_path, engine="c", low_memory=False)
+
+    # large files benefit from the multithreaded PyArrow parser
+    if _HAS_PYARROW:
+        return _read_csv_pyarrow(in_path)
+
+    # otherwise, read large files in chunks
+    return _read_csv_chunked(in_path)
 
 
 def example_function(in_path: Union[str, Path]) -> pd.DataFrame:
@@ -33,9 +138,11 @@ def example_function(in_path: Union[str, Path]) -> pd.DataFrame:
     df = example_function(pth)
     ```
     """
-    df = pd.read_csv(in_path)
+    df = _read_csv_fast(in_path)
 
-    logger.debug(f"Read table with {len(df):,} records from {in_path}.")
+    # only format the record count if it will actually be logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Read table with %s records from %s.", f"{len(df):,}", in_path)
 
     return df
 
@@ -47,11 +154,11 @@ class ExampleObject(object):
     since I _almost always_ have to look this up, and it's a _lot_ easier
     for it to be already templated.
     """
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(self) -> None:
         # initialize parent object if subclassed
-        super().__init__(*args, **kwargs)
+        super().__init__()
 
-        logger.debug(f"Initialized {self.__class__.__name__} object instance.")
+        logger.debug("Initialized %s object instance.", self.__class__.__name__)
 
     @staticmethod
     def example_static_function(in_path: Union[str, Path]) -> pd.DataFrame:
@@ -76,9 +183,11 @@ class ExampleObject(object):
         df = ExampleObject.example_function(pth)
         ```
         """
-        df = pd.read_csv(in_path)
+        df = _read_csv_fast(in_path)
 
-        logger.debug(f"Read table with {len(df):,} records from {in_path}.")
+        # only format the record count if it will actually be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Read table with %s records from %s.", f"{len(df):,}", in_path)
 
         return df
 
@@ -105,7 +214,7 @@ class ExampleObject(object):
 
         object_instance = cls()
 
-        logger.debug(f"Created {cls.__name__} instance via class method.")
+        logger.debug("Created %s instance via class method.", cls.__name__)
 
         return object_instance
     
\ No newline at end of file
@@ -28,8 +28,7 @@ dir_prj = script_pth.parent.parent
 dir_logs = dir_prj / 'data' / 'logs'
 
 # ensure the log directory exists
-if not dir_logs.exists():
-    dir_logs.mkdir(parents=True)
+dir_logs.mkdir(parents=True, exist_ok=True)
 
 # get the name of the scritp without the .py extension
 script_name = script_pth.stem
@@ -52,12 +51,28 @@ if __name__ == "__main__":
 
 """
 from importlib.util import find_spec
+import io
 import logging
+import os
 from pathlib import Path
 from typing import Union, Optional
 
 __all__ = ["get_logger", "format_df_for_logging", "ArcpyHandler"]
 
+# availability of optional dependencies does not change during the lifetime of the process, so only check once
+_HAS_ARCPY = find_spec("arcpy") is not None
+_HAS_PANDAS = find_spec("pandas") is not None
+
+if _HAS_PANDAS:
+    import pandas as pd
+
+# valid logging levels for get_logger
+_LOG_STR_SET = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL", "WARN", "FATAL"})
+_LOG_INT_SET = frozenset({0, 10, 20, 30, 40, 50})
+
+# formatters keyed by format string, so handlers configured with the same format share a single formatter
+_FORMATTER_CACHE: dict[str, logging.Formatter] = {}
+
 
 class ArcpyHandler(logging.Handler):
     """
@@ -86,7 +101,7 @@ class ArcpyHandler(logging.Handler):
 
     def __init__(self, level: Union[int, str] = 10):
         # throw logical error if arcpy not available
-        if find_spec("arcpy") is None:
+        if not _HAS_ARCPY:
             raise EnvironmentError(
                 "The ArcPy handler requires an environment with ArcPy, a Python environment with "
                 "ArcGIS Pro or ArcGIS Enterprise."
@@ -95,6 +110,21 @@ class ArcpyHandler(logging.Handler):
         # call the parent to cover rest of any potential setup
         super().__init__(level=level)
 
+        # late import to avoid issues in non-ArcPy environments
+        import arcpy
+
+        # ArcPy messaging methods indexed by logging level divided by ten; NOTSET (0), DEBUG (10) and INFO (20)
+        # through AddMessage, WARN (30) through AddWarning, and ERROR (40), FATAL (50) and CRITICAL (50)
+        # through AddError
+        self._dispatch = (
+            arcpy.AddMessage,
+            arcpy.AddMessage,
+            arcpy.AddMessage,
+            arcpy.AddWarning,
+            arcpy.AddError,
+            arcpy.AddError,
+        )
+
     def emit(self, record: logging.LogRecord) -> None:
         """
         Args:
@@ -104,23 +134,8 @@ class ArcpyHandler(logging.Handler):
             This method should not be called directly, but rather enables the `Logger` methods to
             be able to use this handler correctly.
         """
-        # run through the formatter to honor logging formatter settings
-        msg = self.format(record)
-
-        # late import to avoid issues in non-ArcPy environments
-        import arcpy
-
-        # route anything NOTSET (0), DEBUG (10) or INFO (20) through AddMessage
-        if record.levelno <= 20:
-            arcpy.AddMessage(msg)
-
-        # route all WARN (30) messages through AddWarning
-        elif record.levelno == 30:
-            arcpy.AddWarning(msg)
-
-        # everything else; ERROR (40), FATAL (50) and CRITICAL (50), route through AddError
-        else:
-            arcpy.AddError(msg)
+        # run through the formatter to honor logging formatter settings, and route based on the level
+        self._dispatch[min(record.levelno // 10, 5)](self.format(record))
 
 
 # setup logging
@@ -174,66 +189,94 @@ def get_logger(
 
     """
     # ensure valid logging level
-    log_str_lst = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL", "WARN", "FATAL"]
-    log_int_lst = [0, 10, 20, 30, 40, 50]
-
     if not isinstance(level, (str, int)):
         raise ValueError(
             "You must define a specific logging level for log_level as a string or integer."
         )
-    elif isinstance(level, str) and level not in log_str_lst:
+    elif isinstance(level, str) and level not in _LOG_STR_SET:
         raise ValueError(
-            f'The log_level must be one of {log_str_lst}. You provided "{level}".'
+            f'The log_level must be one of {sorted(_LOG_STR_SET)}. You provided "{level}".'
         )
-    elif isinstance(level, int) and level not in log_int_lst:
+    elif isinstance(level, int) and level not in _LOG_INT_SET:
         raise ValueError(
-            f"If providing an integer for log_level, it must be one of the following, {log_int_lst}."
+            f"If providing an integer for log_level, it must be one of the following, {sorted(_LOG_INT_SET)}."
         )
 
-    # get default logger and set logging level at the same time
+    # get default logger
     logger = logging.getLogger(logger_name)
-    logger.setLevel(level=level)
 
-    # configure formatting
-    log_frmt = logging.Formatter(log_format)
+    # only set the level if it differs, since setting the level clears the cache for all loggers
+    level_int = logging.getLevelName(level) if isinstance(level, str) else level
+    if logger.level != level_int:
+        logger.setLevel(level=level_int)
+
+    # configure formatting, reusing the formatter if one already exists for the format
+    log_frmt = _FORMATTER_CACHE.get(log_format)
+    if log_frmt is None:
+        log_frmt = _FORMATTER_CACHE.setdefault(log_format, logging.Formatter(log_format))
 
     # set propagation
     logger.propagate = propagate
 
+    # index handlers previously added by this function by their tag in a single pass over the handlers
+    tagged_handlers = {getattr(h, "_icloud_tag", None): h for h in logger.handlers}
+
     # add or update stream handler if requested
     if add_stream_handler:
 
-        # get existing stream hander if one in the logger
-        stream_handler = next(
-            (h for h in logger.handlers if isinstance(h, logging.StreamHandler)),
-            None
-        )
+        # get existing stream hander if one in the logger, falling back to an untagged stream handler, but not a
+        # subclass such as a file handler, and tagging it so it is found directly next time
+        stream_handler = tagged_handlers.get("stream")
+        if stream_handler is None:
+            stream_handler = next((h for h in logger.handlers if type(h) is logging.StreamHandler), None)
+            if stream_handler is not None:
+                stream_handler._icloud_tag = "stream"
         
         # if no stream handler exists, create one and add it to the logger
         if stream_handler is None:
             stream_handler = logging.StreamHandler()
+            stream_handler._icloud_tag = "stream"
             logger.addHandler(stream_handler)
         
-        # set the formatter for the stream handler
-        stream_handler.setFormatter(log_frmt)
+        # set the formatter for the stream handler if not already using it
+        if stream_handler.formatter is not log_frmt:
+            stream_handler.setFormatter(log_frmt)
 
 
     # if in an environment with ArcPy, and desired, add handler to bubble logging up to ArcGIS through ArcPy
-    if find_spec("arcpy") is not None and add_arcpy_handler:
-        ah = ArcpyHandler()
-        ah.setFormatter(log_frmt)
-        logger.addHandler(ah)
+    if _HAS_ARCPY and add_arcpy_handler:
+
+        # get existing ArcPy handler if one in the logger
+        ah = tagged_handlers.get("arcpy")
+
+        # only add the handler if the logger does not already have one
+        if ah is None:
+            ah = ArcpyHandler()
+            ah._icloud_tag = "arcpy"
+            logger.addHandler(ah)
+
+        # set the formatter for the ArcPy handler if not already using it
+        if ah.formatter is not log_frmt:
+            ah.setFormatter(log_frmt)
 
     # if a path for the logfile is provided, log results to the file
     if logfile_path is not None:
         # ensure the full path exists
-        if not logfile_path.parent.exists():
-            logfile_path.parent.mkdir(parents=True)
+        Path(logfile_path).parent.mkdir(parents=True, exist_ok=True)
+
+        # get existing file handler writing to this file if one in the logger
+        log_file = os.path.abspath(logfile_path)
+        fh = tagged_handlers.get(f"file:{log_file}")
 
-        # create and add the file handler
-        fh = logging.FileHandler(str(logfile_path))
-        fh.setFormatter(log_frmt)
-        logger.addHandler(fh)
+        # only create and add the file handler if the logger is not already writing to this file
+        if fh is None:
+            fh = logging.FileHandler(log_file)
+            fh._icloud_tag = f"file:{log_file}"
+            logger.addHandler(fh)
+
+        # set the formatter for the file handler if not already using it
+        if fh.formatter is not log_frmt:
+            fh.setFormatter(log_frmt)
 
     return logger
 
@@ -254,20 +297,23 @@ def format_df_for_logging(
         title: String title describing the data frame.
         line_tab_prefix: Optional string comprised of tabs (``\\t\\t``) to prefix each line with providing indentation.
     """
-    if find_spec('pandas') is None:
+    if not _HAS_PANDAS:
         raise ImportError("Pandas is required to use 'format_df_for_logging'.")
-    
-    # late import to avoid issues in non-Pandas environments
-    import pandas as pd
 
     # ensure proper type
     if not isinstance(pandas_df, pd.DataFrame):
         raise TypeError("The 'pandas_df' argument must be a Pandas DataFrame.")
     
-    # format the data frame to a string with each line prefixed by the provided tab prefix
-    log_str = line_tab_prefix.join(pandas_df.to_string(index=False).splitlines(True))
-
-    # add title
-    log_str = f"{title}:\n{line_tab_prefix}{log_str}"
-
-    return log_str
+    # write the data frame to a buffer rather than creating an intermediate string
+    df_buf = io.StringIO()
+    pandas_df.to_string(buf=df_buf, index=False)
+
+    # add title, then each line of the data frame prefixed by the provided tab prefix
+    buf = io.StringIO()
+    buf.write(title)
+    buf.write(":\n")
+    for line in df_buf.getvalue().splitlines(True):
+        buf.write(line_tab_prefix)
+        buf.write(line)
+
+    return buf.getvalue()
@@ -1,6 +1,6 @@
 """Useful utility functions for icloud_contacts_organizer."""
 
-from ._logging import get_logger
+import logging
 
-# set up module-level logger
-logger = get_logger("icloud_contacts_organizer.utils", level="DEBUG", add_stream_handler=False)
+# module-level logger, a child of the package-level logger so it uses the same configuration
+logger = logging.getLogger("icloud_contacts_organizer.utils")
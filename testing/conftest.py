@@ -4,28 +4,58 @@ Pytest configuration file for icloud-contacts-organizer tests.
 It is used to set up fixtures and configurations for running tests, 
 especially when tests are spread acrsoss multiple files.
 """
+import logging
+import sys
 import tempfile
+import uuid
 from pathlib import Path
 from typing import Generator
 
 import pytest
 
+# ignore errors from files still locked during cleanup, only supported starting with Python 3.10
+_TEMP_DIR_KWARGS = {"ignore_cleanup_errors": True} if sys.version_info >= (3, 10) else {}
+
 @pytest.fixture(scope="function")
 def temp_dir() -> Generator[Path, None, None]:
     """Create a temporary directory for testing purposes. When the test is done, the directory and its contents are deleted."""
-    with tempfile.TemporaryDirectory() as tmpdirname:
+    with tempfile.TemporaryDirectory(**_TEMP_DIR_KWARGS) as tmpdirname:
         yield Path(tmpdirname)
 
 
 @pytest.fixture(scope="function")
-def temp_gdb(temp_dir: Path) -> Generator[Path, None, None]:
-    """Create a temporary file geodatabase for testing purposes. When the test is done, the geodatabase and its contents are deleted."""
+def temp_logger_name() -> Generator[str, None, None]:
+    """Provide a unique logger name for testing purposes. When the test is done, the logger's handlers are closed and removed."""
+    logger_name = f"test_{uuid.uuid4().hex}"
+    yield logger_name
+    logger = logging.getLogger(logger_name)
+    for h in list(logger.handlers):
+        h.close()
+        logger.removeHandler(h)
+
+
+@pytest.fixture(scope="session")
+def session_gdb() -> Generator[Path, None, None]:
+    """Create a temporary file geodatabase shared by all tests in the session, since creating a file geodatabase is slow. When the session is done, the geodatabase and its contents are deleted."""
+    import arcpy
+    with tempfile.TemporaryDirectory(**_TEMP_DIR_KWARGS) as tmpdirname:
+        gdb_pth: str = arcpy.management.CreateFileGDB(tmpdirname, "test.gdb")[0]
+        yield Path(gdb_pth)
+        # without ignore_cleanup_errors (before Python 3.10), geodatabase lock files can prevent the temporary
+        # directory from being removed, so delete the geodatabase first
+        if not _TEMP_DIR_KWARGS and arcpy.Exists(gdb_pth):
+            arcpy.management.Delete(gdb_pth)
+
+
+@pytest.fixture(scope="function")
+def temp_feature_dataset(session_gdb: Path) -> Generator[Path, None, None]:
+    """Create a uniquely named feature dataset in the session geodatabase for testing purposes. When the test is done, the feature dataset and its contents are deleted."""
     import arcpy
-    gdb_pth: str = arcpy.management.CreateFileGDB(str(temp_dir), "test.gdb")[0]
-    yield Path(gdb_pth)
-    # do a little cleanup so the temporary directory can be removed by temp_dir fixture
-    if arcpy.Exists(gdb_pth):
-        arcpy.management.Delete(gdb_pth)
+    fds_name = f"test_{uuid.uuid4().hex}"
+    fds_pth: str = arcpy.management.CreateFeatureDataset(str(session_gdb), fds_name, arcpy.SpatialReference(4326))[0]
+    yield Path(fds_pth)
+    if arcpy.Exists(fds_pth):
+        arcpy.management.Delete(fds_pth)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -6,6 +6,8 @@ easily be modified to support any testing framework.
 from pathlib import Path
 import sys
 
+import pytest
+
 # get paths to useful resources - notably where the src directory is
 self_pth = Path(__file__)
 dir_test = self_pth.parent
@@ -17,4 +19,132 @@ sys.path.insert(0, str(dir_src))
 import icloud_contacts_organizer
 
 def test_example():
-    assert 2 + 2 == 4
\ No newline at end of file
+    assert 2 + 2 == 4
+
+def test_get_logger_repeat_call(temp_logger_name):
+    from icloud_contacts_organizer.utils import get_logger
+
+    logger = get_logger(temp_logger_name, level="DEBUG")
+    handler_count = len(logger.handlers)
+
+    # calling again with the same arguments returns the same logger without adding handlers
+    assert get_logger(temp_logger_name, level="DEBUG") is logger
+    assert len(logger.handlers) == handler_count
+
+def test_example_function(temp_dir):
+    csv_pth = temp_dir / "test.csv"
+    csv_pth.write_text("id,name\n1,a\n2,b\n3,c\n")
+
+    df = icloud_contacts_organizer.example_function(csv_pth)
+
+    assert list(df.columns) == ["id", "name"]
+    assert len(df) == 3
+
+def test_format_df_for_logging():
+    import pandas as pd
+    from icloud_contacts_organizer.utils import format_df_for_logging
+
+    df = pd.DataFrame({"id": [1, 2], "name": ["a", "b"]})
+
+    log_str = format_df_for_logging(df, title="Test", line_tab_prefix="\t")
+
+    expected = "Test:\n\t" + "\t".join(df.to_string(index=False).splitlines(True))
+    assert log_str == expected
+
+def test_get_logger_reconfigure_handlers(temp_dir, temp_logger_name):
+    import logging
+    from icloud_contacts_organizer.utils import get_logger
+
+    logfile_path = temp_dir / "logs" / "test.log"
+
+    logger = get_logger(temp_logger_name, level="INFO", logfile_path=logfile_path)
+    logger = get_logger(temp_logger_name, level="DEBUG", logfile_path=logfile_path)
+
+    # the file handler is a stream handler subclass, but should not be mistaken for the stream handler
+    handler_types = sorted(type(h).__name__ for h in logger.handlers)
+    assert handler_types == ["FileHandler", "StreamHandler"]
+    assert logger.level == logging.DEBUG
+
+
+def test_get_logger_existing_user_handlers(temp_dir, temp_logger_name):
+    import logging
+    from icloud_contacts_organizer.utils import get_logger
+
+    # handlers added directly by the user, not through get_logger
+    logger = logging.getLogger(temp_logger_name)
+    user_file_handler = logging.FileHandler(str(temp_dir / "user.log"))
+    user_file_formatter = logging.Formatter("%(message)s")
+    user_file_handler.setFormatter(user_file_formatter)
+    user_stream_handler = logging.StreamHandler()
+    logger.addHandler(user_file_handler)
+    logger.addHandler(user_stream_handler)
+
+    get_logger(temp_logger_name, level="DEBUG")
+    get_logger(temp_logger_name, level="DEBUG")
+
+    # the user stream handler is reused as the one tagged stream handler, and the file handler is left alone
+    tagged_handlers = [h for h in logger.handlers if getattr(h, "_icloud_tag", None) == "stream"]
+    assert tagged_handlers == [user_stream_handler]
+    assert user_file_handler in logger.handlers
+    assert user_file_handler.formatter is user_file_formatter
+    assert len(logger.handlers) == 2
+
+@pytest.mark.parametrize("has_pyarrow", [True, False])
+def test_read_csv_fast_large_file(temp_dir, monkeypatch, has_pyarrow):
+    import pandas as pd
+    from icloud_contacts_organizer import _main
+
+    if has_pyarrow:
+        pytest.importorskip("pyarrow")
+
+    csv_pth = temp_dir / "test.csv"
+    # include dates and times, which only the PyArrow parser infers, and a column with text only after the
+    # first chunk, which the chunked reader infers differently per chunk
+    csv_pth.write_text(
+        "id,name,value,day,timestamp,time,mixed,flag,empty\n"
+        "1,a,1.5,2024-01-01,2024-01-01T10:00:00,12:30:00,1,True,\n"
+        "2,,,2024-01-02,2024-01-02T10:00:00,12:31:00,2,False,\n"
+        "3,c,3.5,2024-01-03,2024-01-03T10:00:00,12:32:00,x,True,\n"
+        "4,NA,4.5,2024-01-04,2024-01-04T10:00:00,12:33:00,4,,\n"
+        "5,e,5.5,2024-01-05,2024-01-05T10:00:00,12:34:00,5,False,\n"
+    )
+
+    small_df = _main._read_csv_fast(csv_pth)
+
+    # treat every file as large, and use small chunks so the chunked read is combined from several chunks
+    monkeypatch.setattr(_main, "_LARGE_FILE_THRESHOLD", 0)
+    monkeypatch.setattr(_main, "_CSV_CHUNKSIZE", 2)
+    monkeypatch.setattr(_main, "_HAS_PYARROW", has_pyarrow)
+
+    large_df = _main._read_csv_fast(csv_pth)
+
+    pd.testing.assert_frame_equal(large_df, small_df)
+
+def test_arcpy_handler_dispatch(monkeypatch):
+    import logging
+    import types
+    from icloud_contacts_organizer.utils import _logging
+
+    # stub out ArcPy so the handler can be tested without an ArcGIS environment
+    calls = []
+    arcpy_stub = types.ModuleType("arcpy")
+    arcpy_stub.AddMessage = lambda msg: calls.append(("AddMessage", msg))
+    arcpy_stub.AddWarning = lambda msg: calls.append(("AddWarning", msg))
+    arcpy_stub.AddError = lambda msg: calls.append(("AddError", msg))
+    monkeypatch.setitem(sys.modules, "arcpy", arcpy_stub)
+    monkeypatch.setattr(_logging, "_HAS_ARCPY", True)
+
+    handler = _logging.ArcpyHandler()
+
+    expected = {
+        10: "AddMessage",
+        20: "AddMessage",
+        30: "AddWarning",
+        35: "AddWarning",
+        40: "AddError",
+        50: "AddError",
+    }
+    for levelno, method_name in expected.items():
+        calls.clear()
+        handler.emit(logging.makeLogRecord({"levelno": levelno, "msg": f"level {levelno}"}))
+        assert calls == [(method_name, f"level {levelno}")]